@@ -20,6 +20,17 @@ def from_char(data: Union[ct.c_char, ct.Array[ct.c_char]], n_str: int) -> Iterat
     String sizes are not bounded.
     For ct.c_char and arrays of it.
     """
+    if n_str == 0:
+        return
+    if isinstance(data, ct.Array):
+        # Buffer size is known: copy it at once, and look for the end
+        # of the last string on the copy.
+        value = data.raw
+        end = -1
+        for _ in range(n_str):
+            end = value.index(b'\0', end + 1)
+        yield from value[:end].decode().split('\0')
+        return
     data_addr = ct.addressof(data)
     for _ in range(n_str):
         value = ct.string_at(data_addr)
@@ -62,12 +73,13 @@ def from_n_char_array(data: Union[ct.c_char, ct.Array[ct.c_char]], str_size: int
     Each string cannot be longer than str_size - 1.
     For ct.c_char and arrays of it.
     """
-    data_addr = ct.addressof(data)
-    for _ in range(n_str):
-        value = ct.string_at(data_addr)
-        assert len(value) < str_size
-        data_addr += str_size
-        yield value.decode()
+    # Copy the whole buffer at once, then split it
+    size = str_size * n_str
+    value = ct.string_at(ct.addressof(data), size)
+    for begin in range(0, size, str_size):
+        end = value.find(b'\0', begin, begin + str_size)
+        assert end != -1
+        yield value[begin:end].decode()
 
 
 def from_n_char_array_p(data: ct._Pointer, str_size: int, n_str: int) -> Iterator[str]:
@@ -7,15 +7,19 @@ __copyright__ = 'Copyright (C) 2024 CAEN SpA'
 __license__ = 'LGPL-3.0-or-later'
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import array
 import ctypes as ct
 import ctypes.wintypes as ctw
+import errno
 import os
 import socket
+import struct
 import sys
 from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import IntEnum, unique
+from functools import lru_cache
 from typing import Any, ClassVar, Optional, TypeVar, Union
 
 from caen_libs import _cache, _string, _utils, error
@@ -341,25 +345,32 @@ else:
     _socket = ct.c_int
 
 
+# Lookup tables, faster than enum constructors on event decoding
+_EVENT_TYPE_FROM_VALUE: dict[int, EventType] = {i.value: i for i in EventType}
+_EVENT_STATUS_FROM_VALUE: dict[int, EventStatus] = {i.value: i for i in EventStatus}
+
+
 _SYS_PROP_TYPE_GET_ARG: dict[SysPropType, Callable] = {
+    # struct.unpack_from is much faster than building ctypes objects on the buffer
     SysPropType.STR:        lambda v: v.value.decode(),
-    SysPropType.REAL:       lambda v: ct.cast(v, _P(ct.c_float)).contents.value,
-    SysPropType.UINT2:      lambda v: ct.cast(v, _P(ct.c_uint16)).contents.value,
-    SysPropType.UINT4:      lambda v: ct.cast(v, _P(ct.c_uint32)).contents.value,
-    SysPropType.INT2:       lambda v: ct.cast(v, _P(ct.c_int16)).contents.value,
-    SysPropType.INT4:       lambda v: ct.cast(v, _P(ct.c_int32)).contents.value,
-    SysPropType.BOOLEAN:    lambda v: bool(ct.cast(v, _P(ct.c_uint)).contents.value),
+    SysPropType.REAL:       lambda v: struct.unpack_from('f', v)[0],
+    SysPropType.UINT2:      lambda v: struct.unpack_from('H', v)[0],
+    SysPropType.UINT4:      lambda v: struct.unpack_from('I', v)[0],
+    SysPropType.INT2:       lambda v: struct.unpack_from('h', v)[0],
+    SysPropType.INT4:       lambda v: struct.unpack_from('i', v)[0],
+    SysPropType.BOOLEAN:    lambda v: bool(struct.unpack_from('I', v)[0]),
 }
 
 
 _SYS_PROP_TYPE_SET_ARG: dict[SysPropType, Callable] = {
+    # byref is lighter than pointer, that creates a full pointer instance
     SysPropType.STR:        lambda v: v.encode(),
-    SysPropType.REAL:       lambda v: ct.pointer(ct.c_float(v)),
-    SysPropType.UINT2:      lambda v: ct.pointer(ct.c_uint16(v)),
-    SysPropType.UINT4:      lambda v: ct.pointer(ct.c_uint32(v)),
-    SysPropType.INT2:       lambda v: ct.pointer(ct.c_int16(v)),
-    SysPropType.INT4:       lambda v: ct.pointer(ct.c_int32(v)),
-    SysPropType.BOOLEAN:    lambda v: ct.pointer(ct.c_uint(v)),
+    SysPropType.REAL:       lambda v: ct.byref(ct.c_float(v)),
+    SysPropType.UINT2:      lambda v: ct.byref(ct.c_uint16(v)),
+    SysPropType.UINT4:      lambda v: ct.byref(ct.c_uint32(v)),
+    SysPropType.INT2:       lambda v: ct.byref(ct.c_int16(v)),
+    SysPropType.INT4:       lambda v: ct.byref(ct.c_int32(v)),
+    SysPropType.BOOLEAN:    lambda v: ct.byref(ct.c_uint(v)),
 }
 
 
@@ -379,17 +390,46 @@ _PARAM_TYPE_GET_ARG: dict[ParamType, Callable[[int], ct.Array]] = {
 }
 
 
+# Length from which building index arrays from an array.array buffer is
+# faster than unpacking the values on the array constructor.
+_INDEX_ARRAY_FROM_BUFFER_MIN_LEN = 8
+
+
+def _index_array(indexes: Sequence[int]) -> ct.Array:
+    """
+    Array of unsigned short with the given indexes. Unpacking on the
+    constructor is about 2x faster for the common case of one or two
+    indexes, but its cost grows faster with the length: from_buffer on
+    an array.array is about 1.6x faster at 16 indexes. The array
+    returned by from_buffer keeps a reference to the buffer.
+    """
+    n_indexes = len(indexes)
+    if n_indexes < _INDEX_ARRAY_FROM_BUFFER_MIN_LEN:
+        return (ct.c_ushort * n_indexes)(*indexes)
+    return (ct.c_ushort * n_indexes).from_buffer(array.array('H', indexes))
+
+
+def _filled_array(ctype: type[ct._SimpleCData], value: Any, n: int) -> ct.Array:
+    """
+    Array of n elements, all set to value. Slice assignment is
+    much faster than unpacking the values on the array constructor.
+    """
+    res = (ctype * n)()
+    res[:] = [value] * n
+    return res
+
+
 _PARAM_TYPE_SET_ARG: dict[ParamType, Callable[[Any, int], Any]] = {
     # We generate an array with the same value for the reason described
     # in the caller docstring.
     # c_int is replaced by c_uint on some systems, but should be the same.
-    ParamType.NUMERIC:      lambda v, n: (ct.c_float * n)(*[v]*n),
-    ParamType.ONOFF:        lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.CHSTATUS:     lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.BDSTATUS:     lambda v, n: (ct.c_int * n)(*[v]*n),
-    ParamType.BINARY:       lambda v, n: (ct.c_int * n)(*[v]*n),
+    ParamType.NUMERIC:      lambda v, n: _filled_array(ct.c_float, v, n),
+    ParamType.ONOFF:        lambda v, n: _filled_array(ct.c_int, v, n),
+    ParamType.CHSTATUS:     lambda v, n: _filled_array(ct.c_int, v, n),
+    ParamType.BDSTATUS:     lambda v, n: _filled_array(ct.c_int, v, n),
+    ParamType.BINARY:       lambda v, n: _filled_array(ct.c_int, v, n),
     ParamType.STRING:       lambda v, n: v.encode(),  # no array here, only first value is used
-    ParamType.ENUM:         lambda v, n: (ct.c_int * n)(*[v]*n),
+    ParamType.ENUM:         lambda v, n: _filled_array(ct.c_int, v, n),
     ParamType.CMD:          lambda v, n: ct.c_void_p(),  # value ignored, return a null pointer
 }
 
@@ -417,6 +457,25 @@ _PARAM_TYPE_EVENT_ARG: dict[ParamType, Callable[[_IdValueRaw], Union[str, float,
 }
 
 
+@lru_cache(maxsize=256)
+def _encode_name(name: str) -> bytes:
+    """
+    Encoded name of parameters, properties and commands. Cached
+    because the same few names are used on every call.
+    """
+    return name.encode()
+
+
+@lru_cache(maxsize=128)
+def _encode_param_list(param_list: tuple[str, ...]) -> bytes:
+    """
+    Colon separated list of parameters used by subscribe functions.
+    Cached because the same lists are usually subscribed and
+    unsubscribed repeatedly.
+    """
+    return ':'.join(param_list).encode()
+
+
 class _Lib(_utils.Lib):
 
     def __init__(self, name: str) -> None:
@@ -430,6 +489,9 @@ class _Lib(_utils.Lib):
         self.__free = self.__get('Free', ct.c_void_p, handle_errcheck=False)
         self.__sw_rel = self.__get_str('LibSwRel', legacy=True)
 
+        # Library version cannot change once loaded
+        self.__support_32bit_pid = self.__ver_at_least((7, 0, 0))
+
         # Load API
         self.init_system = self.__get('InitSystem', ct.c_int, ct.c_int, ct.c_void_p, _c_char_p, _c_char_p, _c_int_p)
         self.deinit_system = self.__get('DeinitSystem', ct.c_int)
@@ -461,7 +523,8 @@ class _Lib(_utils.Lib):
         self.__get_error = self.__get_str('GetError', ct.c_int)
 
     def __api_errcheck(self, res: int, func: Callable, _: tuple) -> int:
-        if res != Error.Code.OK:
+        # Compare with int literal, faster than comparing with Error.Code.OK
+        if res != 0:
             raise Error('details not available', res, func.__name__)
         return res
 
@@ -475,13 +538,16 @@ class _Lib(_utils.Lib):
         The handle is obtained assuming it is the first argument
         of the failed function.
         """
-        if res != Error.Code.OK:
+        if res != 0:  # see __api_errcheck
             handle = func_args[0]  # first argument is always handle
             raise Error(self.get_error(handle), res, func.__name__)
         return res
 
     def __get(self, name: str, *args: type, **kwargs) -> Callable[..., int]:
         # Use lib_variadic as API is __cdecl
+        # Functions not loaded with pydll release the GIL during the call,
+        # errcheck is run after it has been acquired again: blocking calls
+        # on different handles can be done in parallel from different threads.
         func = getattr(self.lib_variadic, f'CAENHV_{name}')
         func.argtypes = args
         func.restype = ct.c_int
@@ -525,37 +591,44 @@ class _Lib(_utils.Lib):
         """
         Check if library support 32-bit PID
         """
-        return self.__ver_at_least((7, 0, 0))
+        return self.__support_32bit_pid
 
-    @contextmanager
-    def auto_ptr(self, pointer_type):
+    def auto_ptr(self, pointer_type) -> '_AutoPtr':
         """
         Context manager to auto free on scope exit.
 
-        The returned pointer is initialized to NULL to avoid error
-        when freeing, in case callee function does not set the pointer.
+        The returned pointer is initialized to NULL, as any new ctypes
+        pointer, to avoid error when freeing, in case callee function
+        does not set the pointer.
         """
-        value = _P(pointer_type)()
-        assert bool(value) is False  # Must be NULL
-        try:
-            yield value
-        finally:
-            self.__free(value)
+        return _AutoPtr(_P(pointer_type)(), self.__free)
 
-    @contextmanager
-    def evt_data_auto_ptr(self):
+    def evt_data_auto_ptr(self) -> '_AutoPtr':
         """
         Context manager to auto free event data on scope exit
 
-        The returned pointer is initialized to NULL to avoid error
-        when freeing, in case callee function does not set the pointer.
+        The returned pointer is initialized to NULL, as any new ctypes
+        pointer, to avoid error when freeing, in case callee function
+        does not set the pointer.
         """
-        value = _P(_EventDataRaw)()
-        assert bool(value) is False  # Must be NULL
-        try:
-            yield value
-        finally:
-            self.__free_event_data(value)
+        return _AutoPtr(_P(_EventDataRaw)(), self.__free_event_data)
+
+
+@dataclass(**_utils.dataclass_slots)
+class _AutoPtr:
+    """
+    Context manager returned by _Lib.auto_ptr. A plain class is lighter
+    than a generator based @contextmanager, entered on every call that
+    returns memory allocated by the library.
+    """
+    pointer: ct._Pointer
+    free: Callable[[ct._Pointer], Any]
+
+    def __enter__(self) -> Any:
+        return self.pointer
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.free(self.pointer)
 
 
 # Library name is platform dependent
@@ -590,13 +663,39 @@ class Device:
     # Private members
     __opened: bool = field(default=True, repr=False)
     __port: int = field(default=0, repr=False)
+    __subscribed: bool = field(default=False, repr=False)
     __skt_server: Optional[socket.socket] = field(default=None, repr=False)
     __skt_client: Optional[socket.socket] = field(default=None, repr=False)
+    __param_type_cache: dict[tuple[int, str, Optional[int]], ParamType] = field(default_factory=dict, init=False, compare=False, repr=False)
+    __param_mode_cache: dict[tuple[int, str, Optional[int]], ParamMode] = field(default_factory=dict, init=False, compare=False, repr=False)
+    __sys_prop_type_cache: dict[str, SysPropType] = field(default_factory=dict, init=False, compare=False, repr=False)
+
+    # Private members depending on system type, set on __post_init__
+    __legacy_events: bool = field(init=False, repr=False)
+    __library_event_thread: bool = field(init=False, repr=False)
+    __resol_param_prop: bool = field(init=False, repr=False)
+    __new_events_format: bool = field(init=False, repr=False)
+    __char_p_p_str_bd_param_arg: bool = field(init=False, repr=False)
+    __char_p_p_str_ch_param_arg: bool = field(init=False, repr=False)
 
     # Static private members
     __cache_manager: ClassVar[_cache.Manager] = _cache.Manager()
     __first_bind_port: ClassVar[int] = int(os.environ.get('HV_FIRST_BIND_PORT', '10001'))  # This binding will bind TCP ports starting from this value
 
+    def __post_init__(self) -> None:
+        # SY1527/SY2527 have a legacy version of events not supported by this binding
+        self.__legacy_events = self.system_type in (SystemType.SY1527, SystemType.SY2527)
+        # Devices with polling thread within library
+        self.__library_event_thread = self.system_type not in (SystemType.SY4527, SystemType.SY5527, SystemType.R6060)
+        # Devices with weird Resol parameter property on numeric data
+        self.__resol_param_prop = self.system_type in (SystemType.V8100,)
+        # Devices with new events format, with socket opened within the library
+        self.__new_events_format = self.system_type in (SystemType.R6060,)
+        # Devices that requires a char** as argument of get_bd_param of type STRING
+        self.__char_p_p_str_bd_param_arg = self.system_type in (SystemType.N1068, SystemType.N1168, SystemType.N568E)
+        # Devices that requires a char** as argument of get_ch_param of type STRING
+        self.__char_p_p_str_ch_param_arg = self.system_type in (SystemType.N1068, SystemType.N1168, SystemType.N568E, SystemType.V8100)
+
     def __del__(self) -> None:
         if self.__opened:
             self.close()
@@ -635,6 +734,7 @@ class Device:
 
         This will also clear class cache.
         """
+        self.__clear_param_cache()
         lib.deinit_system(self.handle)
         self.__opened = False
 
@@ -646,6 +746,7 @@ class Device:
         This will also clear class cache, since the function
         invalidates some internal stuctures of the C library.
         """
+        self.__clear_param_cache()
         l_nos = ct.c_ushort()
         g_nocl = lib.auto_ptr(ct.c_ushort)
         g_ml = lib.auto_ptr(ct.c_char)
@@ -655,16 +756,17 @@ class Device:
         g_frmaxl = lib.auto_ptr(ct.c_ubyte)
         with g_nocl as l_nocl, g_ml as l_ml, g_dl as l_dl, g_snl as l_snl, g_frminl as l_frminl, g_frmaxl as l_frmaxl:
             lib.get_crate_map(self.handle, l_nos, l_nocl, l_ml, l_dl, l_snl, l_frminl, l_frmaxl)
-            ml = tuple(_string.from_char_p(l_ml, l_nos.value))
-            dl = tuple(_string.from_char_p(l_dl, l_nos.value))
+            n_slots = l_nos.value
+            ml = _string.from_char_p(l_ml, n_slots)
+            dl = _string.from_char_p(l_dl, n_slots)
+            # Copy each array at once with a slice, instead of indexing pointers per slot
+            nocl = l_nocl[:n_slots]
+            snl = l_snl[:n_slots]
+            frminl = l_frminl[:n_slots]
+            frmaxl = l_frmaxl[:n_slots]
             return tuple(
-                Board(
-                    ml[i],
-                    dl[i],
-                    l_snl[i],
-                    l_nocl[i],
-                    FwVersion(l_frmaxl[i], l_frminl[i]),
-                ) if l_nocl[i] != 0 else None for i in range(l_nos.value)
+                Board(m, d, sn, noc, FwVersion(frmax, frmin)) if noc != 0 else None
+                for m, d, sn, noc, frmin, frmax in zip(ml, dl, snl, nocl, frminl, frmaxl)
             )
 
     @_cache.cached(cache_manager=__cache_manager)
@@ -685,7 +787,7 @@ class Device:
         """
         l_prop_mode = ct.c_uint()
         l_prop_type = ct.c_uint()
-        lib.get_sys_prop_info(self.handle, name.encode(), l_prop_mode, l_prop_type)
+        lib.get_sys_prop_info(self.handle, _encode_name(name), l_prop_mode, l_prop_type)
         return SysProp(name, SysPropMode(l_prop_mode.value), SysPropType(l_prop_type.value))
 
     def get_sys_prop(self, name: str) -> Union[str, float, int, bool]:
@@ -693,17 +795,17 @@ class Device:
         Binding of CAENHV_GetSysProp()
         """
         l_value = ct.create_string_buffer(1024)  # Should be enough for all types
-        lib.get_sys_prop(self.handle, name.encode(), l_value)
-        prop_type = self.get_sys_prop_info(name).type
+        lib.get_sys_prop(self.handle, _encode_name(name), l_value)
+        prop_type = self.__get_sys_prop_type(name)
         return _SYS_PROP_TYPE_GET_ARG[prop_type](l_value)
 
     def set_sys_prop(self, name: str, value: Union[str, float, int, bool]) -> None:
         """
         Binding of CAENHV_SetSysProp()
         """
-        prop_type = self.get_sys_prop_info(name).type
+        prop_type = self.__get_sys_prop_type(name)
         l_value = _SYS_PROP_TYPE_SET_ARG[prop_type](value)
-        lib.set_sys_prop(self.handle, name.encode(), l_value)
+        lib.set_sys_prop(self.handle, _encode_name(name), l_value)
 
     def get_bd_param(self, slot_list: Sequence[int], name: str) -> Union[list[str], list[float], list[int]]:
         """
@@ -715,21 +817,15 @@ class Device:
         first_index = slot_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(first_index, name, None)
         l_data = _PARAM_TYPE_GET_ARG[param_type](n_indexes)
-        if param_type is ParamType.STRING and self.__char_p_p_str_bd_param_arg():
-            # Some systems require a char** instead of a char*: we build it using the same buffer, with different decode.
-            p_begin = ct.addressof(l_data)
-            p_size = ct.sizeof(l_data)
-            assert p_size % _STR_SIZE == 0
-            l_data_proxy = (ct.c_void_p * n_indexes)(*range(p_begin, p_begin + p_size, _STR_SIZE))
-        else:
-            l_data_proxy = l_data
-        l_index_list = (ct.c_ushort * n_indexes)(*slot_list)
-        lib.get_bd_param(self.handle, n_indexes, l_index_list, name.encode(), l_data_proxy)
-        if param_type is ParamType.STRING:
-            if self.__char_p_p_str_bd_param_arg():
-                return list(_string.from_n_char_array(l_data, _STR_SIZE, n_indexes))
-            else:
-                return list(_string.from_char(l_data, n_indexes))
+        # Evaluated once, used both to build the argument and to decode it
+        char_p_p = param_type is ParamType.STRING and self.__char_p_p_str_bd_param_arg
+        l_data_proxy = self.__str_array_data_proxy(l_data, n_indexes) if char_p_p else l_data
+        l_index_list = _index_array(slot_list)
+        lib.get_bd_param(self.handle, n_indexes, l_index_list, _encode_name(name), l_data_proxy)
+        if char_p_p:
+            return list(_string.from_n_char_array(l_data, _STR_SIZE, n_indexes))
+        elif param_type is ParamType.STRING:
+            return list(_string.from_char(l_data, n_indexes))
         else:
             return l_data[:]
 
@@ -755,8 +851,8 @@ class Device:
         first_index = slot_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(first_index, name, None)
         l_data = _PARAM_TYPE_SET_ARG[param_type](value, n_indexes)
-        l_index_list = (ct.c_ushort * n_indexes)(*slot_list)
-        lib.set_bd_param(self.handle, n_indexes, l_index_list, name.encode(), l_data)
+        l_index_list = _index_array(slot_list)
+        lib.set_bd_param(self.handle, n_indexes, l_index_list, _encode_name(name), l_data)
 
     def get_bd_param_prop(self, slot: int, name: str) -> ParamProp:
         """
@@ -820,7 +916,7 @@ class Device:
         n_indexes = len(channel_list)
         if n_indexes == 0:
             return []  # type: ignore
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
+        l_index_list = _index_array(channel_list)
         n_allocated_values = n_indexes + 1  # In case library tries to set an empty string after the last
         l_value = (ct.c_char * (self.MAX_CH_NAME * n_allocated_values))()
         lib.get_ch_name(self.handle, slot, n_indexes, l_index_list, l_value)
@@ -833,7 +929,7 @@ class Device:
         n_indexes = len(channel_list)
         if n_indexes == 0:
             return
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
+        l_index_list = _index_array(channel_list)
         lib.set_ch_name(self.handle, slot, n_indexes, l_index_list, name.encode())
 
     def get_ch_param(self, slot: int, channel_list: Sequence[int], name: str) -> Union[list[str], list[float], list[int]]:
@@ -846,21 +942,15 @@ class Device:
         first_index = channel_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(slot, name, first_index)
         l_data = _PARAM_TYPE_GET_ARG[param_type](n_indexes)
-        if param_type is ParamType.STRING and self.__char_p_p_str_ch_param_arg():
-            # Some systems require a char** instead of a char*: we build it using the same buffer, with different decode.
-            p_begin = ct.addressof(l_data)
-            p_size = ct.sizeof(l_data)
-            assert p_size % _STR_SIZE == 0
-            l_data_proxy = (ct.c_void_p * n_indexes)(*range(p_begin, p_begin + p_size, _STR_SIZE))
-        else:
-            l_data_proxy = l_data
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
-        lib.get_ch_param(self.handle, slot, name.encode(), n_indexes, l_index_list, l_data_proxy)
-        if param_type is ParamType.STRING:
-            if self.__char_p_p_str_ch_param_arg():
-                return list(_string.from_n_char_array(l_data, _STR_SIZE, n_indexes))
-            else:
-                return list(_string.from_char(l_data, n_indexes))
+        # Evaluated once, used both to build the argument and to decode it
+        char_p_p = param_type is ParamType.STRING and self.__char_p_p_str_ch_param_arg
+        l_data_proxy = self.__str_array_data_proxy(l_data, n_indexes) if char_p_p else l_data
+        l_index_list = _index_array(channel_list)
+        lib.get_ch_param(self.handle, slot, _encode_name(name), n_indexes, l_index_list, l_data_proxy)
+        if char_p_p:
+            return list(_string.from_n_char_array(l_data, _STR_SIZE, n_indexes))
+        elif param_type is ParamType.STRING:
+            return list(_string.from_char(l_data, n_indexes))
         else:
             return l_data[:]
 
@@ -876,8 +966,8 @@ class Device:
         first_index = channel_list[0]  # Assuming all types are equal
         param_type = self.__get_param_type(slot, name, first_index)
         l_data = _PARAM_TYPE_SET_ARG[param_type](value, n_indexes)
-        l_index_list = (ct.c_ushort * n_indexes)(*channel_list)
-        lib.set_ch_param(self.handle, slot, name.encode(), n_indexes, l_index_list, ct.byref(l_data))
+        l_index_list = _index_array(channel_list)
+        lib.set_ch_param(self.handle, slot, _encode_name(name), n_indexes, l_index_list, ct.byref(l_data))
 
     @_cache.cached(cache_manager=__cache_manager)
     def get_exec_comm_list(self) -> tuple[str, ...]:
@@ -894,7 +984,7 @@ class Device:
         """
         Binding of CAENHV_ExecComm()
         """
-        lib.exec_comm(self.handle, name.encode())
+        lib.exec_comm(self.handle, _encode_name(name))
 
     def subscribe_system_params(self, param_list: Sequence[str]) -> None:
         """
@@ -948,8 +1038,8 @@ class Device:
         with g_event_data as l_ed:
             lib.get_event_data(self.__skt_client.fileno(), l_system_status, l_ed, l_data_number)
             events = tuple(self.__decode_event_data(l_ed, l_data_number.value))
-        system_status = EventStatus(l_system_status.System)
-        board_status = tuple(EventStatus(i) for i in l_system_status.Board)
+        system_status = _EVENT_STATUS_FROM_VALUE[l_system_status.System]
+        board_status = tuple(map(_EVENT_STATUS_FROM_VALUE.__getitem__, l_system_status.Board[:]))
         status = SystemStatus(system_status, board_status)
         return events, status
 
@@ -969,9 +1059,9 @@ class Device:
         l_value = var_type(*args)
         try:
             if channel is None:
-                lib.get_bd_param_prop(self.handle, slot, name.encode(), prop_name, ct.byref(l_value))
+                lib.get_bd_param_prop(self.handle, slot, _encode_name(name), prop_name, ct.byref(l_value))
             else:
-                lib.get_ch_param_prop(self.handle, slot, channel, name.encode(), prop_name, ct.byref(l_value))
+                lib.get_ch_param_prop(self.handle, slot, channel, _encode_name(name), prop_name, ct.byref(l_value))
         except Error as ex:
             if ex.code is Error.Code.PARAMPROPNOTFOUND:
                 default = kwargs.get('default')
@@ -983,42 +1073,85 @@ class Device:
     def __get_param_prop(self, slot: int, name: str, channel: Optional[int]) -> ParamProp:
         """
         Get all parameter properties.
-        Cannot be cached since minval/maxval may depend on the value of
-        other parameters.
+        Only minval/maxval of NUMERIC parameters are read at every call,
+        since they may depend on the value of other parameters.
+        """
+        res = self.__get_cached_param_prop(slot, name, channel)
+        if res.type is ParamType.NUMERIC:
+            # Not defined on some old systems
+            minval = self.__get_prop(slot, name, b'Minval', channel, ct.c_float, default=0.).value
+            maxval = self.__get_prop(slot, name, b'Maxval', channel, ct.c_float, default=0.).value
+            return replace(res, minval=minval, maxval=maxval)
+        return replace(res)  # ParamProp is mutable, return a copy
+
+    @_cache.cached(cache_manager=__cache_manager, maxsize=4096)
+    def __get_cached_param_prop(self, slot: int, name: str, channel: Optional[int]) -> ParamProp:
+        """
+        Get parameter properties that never change.
         """
         # Mandatory values (raise if name is not valid)
         param_type = self.__get_param_type(slot, name, channel)
         param_mode = self.__get_param_mode(slot, name, channel)
         res = ParamProp(param_type, param_mode)
         # Optional values
-        if param_type is ParamType.NUMERIC:
-            # Always defined
-            res.unit = ParamUnit(self.__get_prop(slot, name, b'Unit', channel, ct.c_ushort).value)
-            res.exp = self.__get_prop(slot, name, b'Exp', channel, ct.c_short).value
-            # Not defined on some old systems
-            res.minval = self.__get_prop(slot, name, b'Minval', channel, ct.c_float, default=0.).value
-            res.maxval = self.__get_prop(slot, name, b'Maxval', channel, ct.c_float, default=0.).value
-            res.decimal = self.__get_prop(slot, name, b'Decimal', channel, ct.c_short, default=0).value
-            if self.__resol_param_prop():
-                res.resol = self.__get_prop(slot, name, b'Resol', channel, ct.c_short, default=1).value
-        elif param_type is ParamType.ONOFF:
-            res.onstate = self.__get_prop(slot, name, b'Onstate', channel, ct.c_char * _STR_SIZE).value.decode()
-            res.offstate = self.__get_prop(slot, name, b'Offstate', channel, ct.c_char * _STR_SIZE).value.decode()
-        elif param_type is ParamType.ENUM:
-            res.minval = self.__get_prop(slot, name, b'Minval', channel, ct.c_float).value
-            res.maxval = self.__get_prop(slot, name, b'Maxval', channel, ct.c_float).value
-            n_enums = int(res.maxval - res.minval + 1)
-            assert n_enums <= self.MAX_ENUM_VALS
-            l_value = self.__get_prop(slot, name, b'Enum', channel, ct.c_char * (self.MAX_ENUM_NAME * self.MAX_ENUM_VALS))
-            res.enum = tuple(_string.from_n_char_array(l_value, self.MAX_ENUM_NAME, n_enums))
+        fill_param_prop = self.__fill_param_prop.get(param_type)
+        if fill_param_prop is not None:
+            fill_param_prop(self, res, slot, name, channel)
         return res
 
-    @_cache.cached(cache_manager=__cache_manager, maxsize=4096)
+    def __fill_numeric_param_prop(self, res: ParamProp, slot: int, name: str, channel: Optional[int]) -> None:
+        # Always defined
+        res.unit = ParamUnit(self.__get_prop(slot, name, b'Unit', channel, ct.c_ushort).value)
+        res.exp = self.__get_prop(slot, name, b'Exp', channel, ct.c_short).value
+        # Not defined on some old systems
+        res.decimal = self.__get_prop(slot, name, b'Decimal', channel, ct.c_short, default=0).value
+        if self.__resol_param_prop:
+            res.resol = self.__get_prop(slot, name, b'Resol', channel, ct.c_short, default=1).value
+
+    def __fill_onoff_param_prop(self, res: ParamProp, slot: int, name: str, channel: Optional[int]) -> None:
+        res.onstate = self.__get_prop(slot, name, b'Onstate', channel, ct.c_char * _STR_SIZE).value.decode()
+        res.offstate = self.__get_prop(slot, name, b'Offstate', channel, ct.c_char * _STR_SIZE).value.decode()
+
+    def __fill_enum_param_prop(self, res: ParamProp, slot: int, name: str, channel: Optional[int]) -> None:
+        res.minval = self.__get_prop(slot, name, b'Minval', channel, ct.c_float).value
+        res.maxval = self.__get_prop(slot, name, b'Maxval', channel, ct.c_float).value
+        n_enums = int(res.maxval - res.minval + 1)
+        assert n_enums <= self.MAX_ENUM_VALS
+        l_value = self.__get_prop(slot, name, b'Enum', channel, ct.c_char * (self.MAX_ENUM_NAME * self.MAX_ENUM_VALS))
+        res.enum = tuple(_string.from_n_char_array(l_value, self.MAX_ENUM_NAME, n_enums))
+
+    # Optional properties, by parameter type
+    __fill_param_prop: ClassVar[dict[ParamType, Callable[..., None]]] = {
+        ParamType.NUMERIC:  __fill_numeric_param_prop,
+        ParamType.ONOFF:    __fill_onoff_param_prop,
+        ParamType.ENUM:     __fill_enum_param_prop,
+    }
+
+    def __get_sys_prop_type(self, name: str) -> SysPropType:
+        """
+        Simplified version of get_sys_prop_info used internally to
+        retrieve just prop type.
+
+        Cached on a plain dict, see __get_param_type.
+        """
+        cached_value = self.__sys_prop_type_cache.get(name)
+        if cached_value is not None:
+            return cached_value
+        prop_type = self.__sys_prop_type_cache[name] = self.get_sys_prop_info(name).type
+        return prop_type
+
     def __get_param_type(self, slot: int, name: str, channel: Optional[int]) -> ParamType:
         """
         Simplified version of __get_param_prop used internally to
         retrieve just param type.
+
+        Cached on a plain dict rather than with _cache.cached, being
+        called at least once for each parameter access or event.
         """
+        key = (slot, name, channel)
+        cached_value = self.__param_type_cache.get(key)
+        if cached_value is not None:
+            return cached_value
         # Initialize arg to -1 to detect errors because library functions, at least
         # on some modules like N1470, return success even if the parameter does not
         # exist. We detect this error as the value is not modified by the library,
@@ -1029,61 +1162,59 @@ class Device:
         value = self.__get_prop(slot, name, b'Type', channel, ct.c_uint, ParamType._INVALID).value
         if value == ParamType._INVALID:
             raise Error('Parameter not found', Error.Code.PARAMNOTFOUND.value, '__get_param_type')
-        return ParamType(value)
+        param_type = self.__param_type_cache[key] = ParamType(value)
+        return param_type
 
-    @_cache.cached(cache_manager=__cache_manager, maxsize=4096)
     def __get_param_mode(self, slot: int, name: str, channel: Optional[int]) -> ParamMode:
         """
         Simplified version of __get_param_prop used internally to
         retrieve just param mode.
+
+        Cached on a plain dict, see __get_param_type.
         """
+        key = (slot, name, channel)
+        cached_value = self.__param_mode_cache.get(key)
+        if cached_value is not None:
+            return cached_value
         # See comment on __get_param_type
         # pylint: disable=W0212
         value = self.__get_prop(slot, name, b'Mode', channel, ct.c_uint, ParamType._INVALID).value
         if value == ParamType._INVALID:
             raise Error('Parameter not found', Error.Code.PARAMNOTFOUND.value, '__get_param_mode')
-        return ParamMode(value)
+        param_mode = self.__param_mode_cache[key] = ParamMode(value)
+        return param_mode
+
+    def __clear_param_cache(self) -> None:
+        """
+        Clear instance cache, to be invalidated together with class
+        cache.
+        """
+        self.__param_type_cache.clear()
+        self.__param_mode_cache.clear()
+        self.__sys_prop_type_cache.clear()
 
     def __check_events_support(self) -> None:
         """
         SY1527/SY2527 have a legacy version of events not supported by
         this binding
         """
-        if self.system_type in (SystemType.SY1527, SystemType.SY2527):
+        if self.__legacy_events:
             raise NotImplementedError('Legacy events not supported by this binding.')
 
-    def __library_event_thread(self) -> bool:
-        """
-        Devices with polling thread within library
-        """
-        return self.system_type not in (SystemType.SY4527, SystemType.SY5527, SystemType.R6060)
-
-    def __resol_param_prop(self) -> bool:
-        """
-        Devices with weird Resol parameter property on numeric data
-        """
-        return self.system_type in (SystemType.V8100,)
-
-    def __new_events_format(self) -> bool:
-        """
-        Devices with new events format, with socket opened within the
-        library
-        """
-        return self.system_type in (SystemType.R6060,)
-
-    def __char_p_p_str_bd_param_arg(self) -> bool:
-        """
-        Devices that requires a char** as argument of get_bd_param of
-        type STRING
-        """
-        return self.system_type in (SystemType.N1068, SystemType.N1168, SystemType.N568E)
-
-    def __char_p_p_str_ch_param_arg(self) -> bool:
+    @staticmethod
+    def __str_array_data_proxy(l_data: ct.Array, n_indexes: int) -> ct.Array:
         """
-        Devices that requires a char** as argument of get_ch_param of
-        type STRING
+        Some systems require a char** instead of a char* as argument
+        of STRING parameters: we build it using the same buffer, to be
+        decoded with _string.from_n_char_array.
         """
-        return self.system_type in (SystemType.N1068, SystemType.N1168, SystemType.N568E, SystemType.V8100)
+        p_size = _STR_SIZE * n_indexes
+        assert ct.sizeof(l_data) == p_size
+        p_begin = ct.addressof(l_data)
+        # Slice assignment is faster than unpacking the range on the constructor
+        res = (ct.c_void_p * n_indexes)()
+        res[:] = list(range(p_begin, p_begin + p_size, _STR_SIZE))
+        return res
 
     def __subscribe_params(self, param_list: Sequence[str], slot: Optional[int], channel: Optional[int]) -> None:
         """
@@ -1093,7 +1224,7 @@ class Device:
         if param_list_len == 0:
             return
         self.__init_events_server()
-        l_param_name_list = ':'.join(param_list).encode()
+        l_param_name_list = _encode_param_list(tuple(param_list))
         l_result_codes = (ct.c_char * param_list_len)()
         if slot is None:
             lib.subscribe_system_params(self.handle, self.__port, l_param_name_list, param_list_len, l_result_codes)
@@ -1101,11 +1232,7 @@ class Device:
             lib.subscribe_board_params(self.handle, self.__port, slot, l_param_name_list, param_list_len, l_result_codes)
         else:
             lib.subscribe_channel_params(self.handle, self.__port, slot, channel, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
-            # resuls_codes values are not instances of ::CAENHVRESULT
-            failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'subscribe failed at params {failed_params}')
+        self.__check_result_codes('subscribe', l_result_codes)
 
     def __unsubscribe_params(self, param_list: Sequence[str], slot: Optional[int], channel: Optional[int]) -> None:
         """
@@ -1114,7 +1241,7 @@ class Device:
         param_list_len = len(param_list)
         if param_list_len == 0:
             return
-        l_param_name_list = ':'.join(param_list).encode()
+        l_param_name_list = _encode_param_list(tuple(param_list))
         l_result_codes = (ct.c_char * param_list_len)()
         if slot is None:
             lib.unsubscribe_system_params(self.handle, self.__port, l_param_name_list, param_list_len, l_result_codes)
@@ -1122,45 +1249,63 @@ class Device:
             lib.unsubscribe_board_params(self.handle, self.__port, slot, l_param_name_list, param_list_len, l_result_codes)
         else:
             lib.unsubscribe_channel_params(self.handle, self.__port, slot, channel, l_param_name_list, param_list_len, l_result_codes)
-        result_codes = [int.from_bytes(ec, 'big') for ec in l_result_codes]
-        if any(result_codes):
+        self.__check_result_codes('unsubscribe', l_result_codes)
+
+    @staticmethod
+    def __check_result_codes(op_name: str, l_result_codes: ct.Array[ct.c_char]) -> None:
+        """
+        Raise if any of the result codes of CAENHV_Subscribe*Params()
+        and CAENHV_UnSubscribe*Params() is not zero.
+        """
+        result_codes = l_result_codes.raw
+        if result_codes.count(0) != len(result_codes):
             # resuls_codes values are not instances of ::CAENHVRESULT
             failed_params = {i: ec for i, ec in enumerate(result_codes) if ec}
-            raise RuntimeError(f'unsubscribe failed at params {failed_params}')
+            raise RuntimeError(f'{op_name} failed at params {failed_params}')
 
     def __init_events_server(self):
-        if self.__skt_server is not None:
+        if self.__subscribed:
             return
         self.__check_events_support()
-        if self.__new_events_format():
-            # Nothing to do, client socket initialized within the library. We store
-            # an uninitialized value just as a reminder that a subscription has been
-            # made, to be checked later in __init_events_client to be sure
-            # EventDataSocket is meaningful. No need to set port value, it's ignored.
-            self.__skt_server = socket.socket()
-        else:
+        # With new events format the client socket is initialized within the library
+        # and the port value is ignored: nothing to do.
+        if not self.__new_events_format:
             skt = socket.socket()
-            bind_addr = '127.0.0.1' if self.__library_event_thread() else ''
-            # Find first available port
+            if sys.platform != 'win32':
+                # Allow ports left in TIME_WAIT by previous runs, so that the scan
+                # below usually stops at the first port. Not set on Windows, where
+                # SO_REUSEADDR would allow binding to ports actually in use.
+                skt.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            bind_addr = '127.0.0.1' if self.__library_event_thread else ''
+            # Find first available port. Binding to port 0 would save the scan,
+            # done only once per device, but the port chosen by the system could not
+            # fit the short argument of the subscribe functions, and remote systems
+            # connecting to this socket require a predictable port for firewalls.
             port = self.__first_bind_port
             while True:
                 try:
                     skt.bind((bind_addr, port))
                     break
-                except OSError:
+                except OSError as ex:
+                    # EACCES is returned on Windows for ports in excluded ranges
+                    if ex.errno not in (errno.EADDRINUSE, errno.EACCES):
+                        raise
                     port += 1
             skt.listen(1)  # Just one client
             self.__port = port
             self.__skt_server = skt
+        # Reminder that a subscription has been made, to be checked later in
+        # __init_events_client to be sure EventDataSocket is meaningful.
+        self.__subscribed = True
 
     def __init_events_client(self):
         if self.__skt_client is not None:
             return
         self.__check_events_support()
-        if self.__skt_server is None:
+        if not self.__subscribed:
             # Initialization is done on first call to a subscribe function
             raise RuntimeError('No subscription done.')
-        if self.__new_events_format():
+        if self.__new_events_format:
             # A socket has already been opened by the library: we must use the value
             # returned by the special system property EventDataSocket to get the fd.
             # Since self.get_sys_prop calls get_sys_prop_info to get the output type,
@@ -1171,18 +1316,29 @@ class Device:
             lib.get_sys_prop(self.handle, b'EventDataSocket', ct.byref(l_value))
             self.__skt_client = socket.socket(fileno=l_value.value)
         else:
+            assert self.__skt_server is not None
             self.__skt_client, addr_info = self.__skt_server.accept()
-            if self.__library_event_thread():
+            if self.__library_event_thread:
                 # If connecting to library event thread, ignore the first string
                 # that should contain the string used as InitSystem argument,
                 # except when connecting using TCPIP.
                 assert addr_info[0] == '127.0.0.1'
                 arg = bytearray()
+                buf = bytearray(256)
+                view = memoryview(buf)
                 while True:
-                    char = self.__skt_client.recv(1)
-                    if char == b'\x00':
+                    # Peek a chunk and then consume just up to the null terminator, not
+                    # to steal the first events to the library that reads this socket.
+                    n_peek = self.__skt_client.recv_into(view, 0, socket.MSG_PEEK)
+                    if n_peek == 0:
+                        raise RuntimeError('Connection closed by library event thread.')
+                    end = buf.find(b'\x00', 0, n_peek)
+                    if end != -1:
+                        self.__skt_client.recv_into(view, end + 1)
+                        arg += view[:end]
                         break
-                    arg.extend(char)
+                    self.__skt_client.recv_into(view, n_peek)
+                    arg += view[:n_peek]
                 assert self.arg == arg.decode()
 
     def __extended_get_param_type(self, slot: int, name: str, channel: Optional[int]) -> ParamType:
@@ -1195,29 +1351,31 @@ class Device:
             return ParamType.STRING
         return self.__get_param_type(slot, name, channel)
 
-    def __decode_event_value(self, event_type: EventType, board_index: int, channel_index: int, item_id: str, value: _IdValueRaw) -> Union[str, float, int]:
-        if event_type is not EventType.PARAMETER:
-            return -1
+    def __decode_event_value(self, board_index: int, channel_index: int, item_id: str, value: _IdValueRaw) -> Union[str, float, int]:
         if board_index == -1:
-            prop_type = self.get_sys_prop_info(item_id).type
+            prop_type = self.__get_sys_prop_type(item_id)
             return _SYS_PROP_TYPE_EVENT_ARG[prop_type](value)
         param_type = self.__extended_get_param_type(board_index, item_id, channel_index if channel_index != -1 else None)
         return _PARAM_TYPE_EVENT_ARG[param_type](value)
 
     def __decode_event_data(self, event_data: ct._Pointer, n_events: int) -> Iterator[EventData]:
+        # Loop invariants stored on locals, there could be thousands of events.
+        handle = self.handle
+        decode_event_value = self.__decode_event_value
         for i in range(n_events):
             event: _EventDataRaw = event_data[i]
-            item_id = event.ItemID.decode()
-            if not item_id:
+            raw_item_id = event.ItemID
+            if not raw_item_id:
                 # There could be empty events, expecially from library event thread, to be ignored.
-                assert self.__library_event_thread()
+                assert self.__library_event_thread
                 continue
-            event_type = EventType(event.Type)
-            system_handle = event.SystemHandle
-            assert system_handle == self.handle  # should always be the same
+            item_id = raw_item_id.decode()
+            event_type = _EVENT_TYPE_FROM_VALUE[event.Type]
+            assert event.SystemHandle == handle  # should always be the same
             board_index = event.BoardIndex
             channel_index = event.ChannelIndex
-            value = self.__decode_event_value(event_type, board_index, channel_index, item_id, event.Value)
+            # Only parameter events carry a value, skip the call for the others
+            value = decode_event_value(board_index, channel_index, item_id, event.Value) if event_type is EventType.PARAMETER else -1
             yield EventData(event_type, item_id, board_index, channel_index, value)
 
     # Python utilities
@@ -0,0 +1,38 @@
+import ctypes as ct
+import unittest
+from caen_libs import _string
+
+class TestFromChar(unittest.TestCase):
+    def setUp(self):
+        self.data = ct.create_string_buffer(b'S1\0STR2\0\0S4\0')
+
+    def test_from_char(self):
+        self.assertEqual(list(_string.from_char(self.data, 2)), ['S1', 'STR2'])
+        self.assertEqual(list(_string.from_char(self.data, 4)), ['S1', 'STR2', '', 'S4'])
+
+    def test_from_char_empty(self):
+        self.assertEqual(list(_string.from_char(self.data, 0)), [])
+
+    def test_from_char_p(self):
+        data_p = ct.cast(self.data, ct.POINTER(ct.c_char))
+        self.assertEqual(list(_string.from_char_p(data_p, 2)), ['S1', 'STR2'])
+        self.assertEqual(list(_string.from_char_p(ct.POINTER(ct.c_char)(), 0)), [])
+
+class TestFromNCharArray(unittest.TestCase):
+    def setUp(self):
+        self.data = ct.create_string_buffer(b'S1\0\0\0STR2\0\0\0\0\0\0', 15)
+
+    def test_from_n_char_array(self):
+        self.assertEqual(list(_string.from_n_char_array(self.data, 5, 2)), ['S1', 'STR2'])
+        self.assertEqual(list(_string.from_n_char_array(self.data, 5, 3)), ['S1', 'STR2', ''])
+
+    def test_from_n_char_array_empty(self):
+        self.assertEqual(list(_string.from_n_char_array(self.data, 5, 0)), [])
+
+    def test_from_n_char_array_p(self):
+        data_p = ct.cast(self.data, ct.POINTER(ct.c_char))
+        self.assertEqual(list(_string.from_n_char_array_p(data_p, 5, 2)), ['S1', 'STR2'])
+        self.assertEqual(list(_string.from_n_char_array_p(ct.POINTER(ct.c_char)(), 5, 0)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 """"Test the caenhvwrapper module."""
 
+import ctypes as ct
+import socket
 import unittest
+from contextlib import nullcontext
 from unittest.mock import ANY, DEFAULT, patch
 
 import caen_libs.caenhvwrapper as hv
@@ -37,6 +40,26 @@ class TestHVDevice(unittest.TestCase):
         self.assertEqual(len(crate_map), 0)
         self.mock_lib.get_crate_map.assert_called_once_with(self.device.handle, ANY, ANY, ANY, ANY, ANY, ANY, ANY)
 
+    def test_get_crate_map_boards(self):
+        """Test get_crate_map with boards"""
+        buffers = iter([
+            (ct.c_ushort * 2)(12, 0),
+            ct.create_string_buffer(b'A1535\0\0'),
+            ct.create_string_buffer(b'12 Ch 3.5KV\0\0'),
+            (ct.c_uint * 2)(42, 0),
+            (ct.c_ubyte * 2)(3, 0),
+            (ct.c_ubyte * 2)(1, 0),
+        ])
+        def auto_ptr(ctype):
+            return nullcontext(ct.cast(next(buffers), ct.POINTER(ctype)))
+        self.mock_lib.auto_ptr.side_effect = auto_ptr
+        def side_effect(*args):
+            args[1].value = 2
+            return DEFAULT
+        self.mock_lib.get_crate_map.side_effect = side_effect
+        crate_map = self.device.get_crate_map()
+        self.assertEqual(crate_map, (hv.Board('A1535', '12 Ch 3.5KV', 42, 12, hv.FwVersion(1, 3)), None))
+
     def test_get_sys_prop_list(self):
         """Test get_sys_prop_list"""
         prop_list = self.device.get_sys_prop_list()
@@ -59,11 +82,32 @@ class TestHVDevice(unittest.TestCase):
         self.assertEqual(value, '')
         self.mock_lib.get_sys_prop.assert_called_once_with(self.device.handle, b'TestProp', ANY)
 
+    def test_get_sys_prop_real(self):
+        """Test get_sys_prop of type REAL"""
+        def side_effect_info(*args):
+            args[3].value = hv.SysPropType.REAL.value
+            return DEFAULT
+        self.mock_lib.get_sys_prop_info.side_effect = side_effect_info
+        def side_effect(*args):
+            ct.memmove(args[2], ct.byref(ct.c_float(2.5)), ct.sizeof(ct.c_float))
+            return DEFAULT
+        self.mock_lib.get_sys_prop.side_effect = side_effect
+        self.assertEqual(self.device.get_sys_prop('TestProp'), 2.5)
+
     def test_set_sys_prop(self):
         """Test set_sys_prop"""
         self.device.set_sys_prop('TestProp', 'NewValue')
         self.mock_lib.set_sys_prop.assert_called_once_with(self.device.handle, b'TestProp', ANY)
 
+    def test_set_sys_prop_real(self):
+        """Test set_sys_prop of type REAL"""
+        def side_effect_info(*args):
+            args[3].value = hv.SysPropType.REAL.value
+            return DEFAULT
+        self.mock_lib.get_sys_prop_info.side_effect = side_effect_info
+        self.device.set_sys_prop('TestProp', 2.5)
+        self.assertEqual(self.mock_lib.set_sys_prop.call_args.args[2]._obj.value, 2.5)
+
     def test_get_bd_param(self):
         """Test get_bd_param"""
         def side_effect(*args):
@@ -85,6 +129,20 @@ class TestHVDevice(unittest.TestCase):
         self.device.set_bd_param(slot_list, 'TestParam', 123)
         self.mock_lib.set_bd_param.assert_called_once_with(self.device.handle, 2, ANY, b'TestParam', ANY)
 
+    def test_get_ch_param_prop(self):
+        """Test get_ch_param_prop"""
+        def side_effect(*args):
+            args[5]._obj.value = 0
+            return DEFAULT
+        self.mock_lib.get_ch_param_prop.side_effect = side_effect
+        prop = self.device.get_ch_param_prop(0, 1, 'TestParam')
+        self.assertEqual(prop, hv.ParamProp(hv.ParamType.NUMERIC, hv.ParamMode.RDONLY, 0., 0., hv.ParamUnit.NONE, 0, 0))
+        self.mock_lib.get_ch_param_prop.assert_any_call(self.device.handle, 0, 1, b'TestParam', b'Unit', ANY)
+        # Only minval/maxval are read again
+        n_calls = self.mock_lib.get_ch_param_prop.call_count
+        self.assertEqual(self.device.get_ch_param_prop(0, 1, 'TestParam'), prop)
+        self.assertEqual(self.mock_lib.get_ch_param_prop.call_count, n_calls + 2)
+
     def test_get_ch_param(self):
         """Test get_ch_param"""
         def side_effect(*args):
@@ -96,6 +154,55 @@ class TestHVDevice(unittest.TestCase):
         self.assertEqual(values, [0, 0])
         self.mock_lib.get_ch_param.assert_called_once_with(self.device.handle, 0, b'TestParam', 2, ANY, ANY)
 
+    def test_eq_ignores_caches(self):
+        """Test equality does not depend on cached parameter types"""
+        device = hv.Device.open(hv.SystemType.SY4527, hv.LinkType.TCPIP, '192.168.0.1', 'user', 'password')
+        self.addCleanup(device.close)
+        def side_effect(*args):
+            args[5]._obj.value = 0
+            return DEFAULT
+        self.mock_lib.get_ch_param_prop.side_effect = side_effect
+        self.device.get_ch_param(0, [0], 'TestParam')
+        self.assertEqual(self.device, device)
+
+    def test_get_ch_param_string(self):
+        """Test get_ch_param of type STRING, with char* argument"""
+        def side_effect_prop(*args):
+            args[5]._obj.value = hv.ParamType.STRING
+            return DEFAULT
+        self.mock_lib.get_ch_param_prop.side_effect = side_effect_prop
+        def side_effect(*args):
+            ct.memmove(args[5], b'CH0\0CH1\0', 8)
+            return DEFAULT
+        self.mock_lib.get_ch_param.side_effect = side_effect
+        self.assertEqual(self.device.get_ch_param(0, [0, 1], 'Name'), ['CH0', 'CH1'])
+
+    def test_get_ch_param_string_char_p_p(self):
+        """Test get_ch_param of type STRING, with char** argument"""
+        device = hv.Device.open(hv.SystemType.V8100, hv.LinkType.USB, '0')
+        self.addCleanup(device.close)
+        def side_effect_prop(*args):
+            args[5]._obj.value = hv.ParamType.STRING
+            return DEFAULT
+        self.mock_lib.get_ch_param_prop.side_effect = side_effect_prop
+        def side_effect(*args):
+            for i, p in enumerate(args[5]):
+                ct.memmove(p, f'CH{i}\0'.encode(), 4)
+            return DEFAULT
+        self.mock_lib.get_ch_param.side_effect = side_effect
+        self.assertEqual(device.get_ch_param(0, [0, 1], 'Name'), ['CH0', 'CH1'])
+
+    def test_get_ch_param_type_cache(self):
+        """Test get_ch_param does not query param type twice"""
+        def side_effect(*args):
+            args[5]._obj.value = 0
+            return DEFAULT
+        self.mock_lib.get_ch_param_prop.side_effect = side_effect
+        self.device.get_ch_param(0, [0, 1], 'TestParam')
+        self.device.get_ch_param(0, [0, 1], 'TestParam')
+        self.mock_lib.get_ch_param_prop.assert_called_once_with(self.device.handle, 0, 0, b'TestParam', b'Type', ANY)
+        self.assertEqual(self.mock_lib.get_ch_param.call_count, 2)
+
     def test_set_ch_param(self):
         """Test set_ch_param"""
         def side_effect(*args):
@@ -117,10 +224,127 @@ class TestHVDevice(unittest.TestCase):
         self.device.exec_comm('TestComm')
         self.mock_lib.exec_comm.assert_called_once_with(self.device.handle, b'TestComm')
 
+    def test_subscribe_system_params(self):
+        """Test subscribe_system_params"""
+        self.device.subscribe_system_params(['Sessions'])
+        self.mock_lib.subscribe_system_params.assert_called_once_with(self.device.handle, ANY, b'Sessions', 1, ANY)
+
+    def test_unsubscribe_board_params(self):
+        """Test unsubscribe_board_params"""
+        self.device.unsubscribe_board_params(2, ['Temp'])
+        self.mock_lib.unsubscribe_board_params.assert_called_once_with(self.device.handle, ANY, 2, b'Temp', 1, ANY)
+
+    def test_subscribe_channel_params(self):
+        """Test subscribe_channel_params"""
+        self.device.subscribe_channel_params(0, 1, ['VMon', 'IMon'])
+        self.mock_lib.subscribe_channel_params.assert_called_once_with(self.device.handle, ANY, 0, 1, b'VMon:IMon', 2, ANY)
+
+    def test_subscribe_channel_params_failure(self):
+        """Test subscribe_channel_params with failed params"""
+        def side_effect(*args):
+            args[6][1] = b'\x01'
+            return DEFAULT
+        self.mock_lib.subscribe_channel_params.side_effect = side_effect
+        with self.assertRaisesRegex(RuntimeError, 'subscribe failed at params {1: 1}'):
+            self.device.subscribe_channel_params(0, 1, ['VMon', 'IMon'])
+
+    def test_subscribe_port_in_use(self):
+        """Test subscribe skips ports already in use"""
+        first_port = hv.Device._Device__first_bind_port
+        skt = socket.socket()
+        self.addCleanup(skt.close)
+        try:
+            skt.bind(('', first_port))
+        except OSError:
+            pass  # Already in use by someone else
+        device = hv.Device.open(hv.SystemType.N1470, hv.LinkType.USB, '0_0_0')
+        self.addCleanup(device.close)
+        device.subscribe_channel_params(0, 1, ['VMon'])
+        port = self.mock_lib.subscribe_channel_params.call_args.args[1]
+        self.assertGreater(port, first_port)
+
+    def test_unsubscribe_channel_params(self):
+        """Test unsubscribe_channel_params"""
+        self.device.unsubscribe_channel_params(0, 1, ['VMon', 'IMon'])
+        self.mock_lib.unsubscribe_channel_params.assert_called_once_with(self.device.handle, ANY, 0, 1, b'VMon:IMon', 2, ANY)
+
     def test_get_event_data(self):
         """Test get_event_data"""
         with self.assertRaises(RuntimeError):
             self.device.get_event_data()
 
+    def test_get_event_data_decode(self):
+        """Test get_event_data decode"""
+        device = hv.Device.open(hv.SystemType.R6060, hv.LinkType.TCPIP, '192.168.0.2')
+        self.addCleanup(device.close)
+        device.subscribe_channel_params(0, 1, ['VMon'])
+        skt_lib, skt_user = socket.socketpair()
+        self.addCleanup(skt_user.close)
+        def get_sys_prop_side_effect(*args):
+            args[2]._obj.value = skt_lib.detach()
+            return DEFAULT
+        self.mock_lib.get_sys_prop.side_effect = get_sys_prop_side_effect
+        def get_ch_param_prop_side_effect(*args):
+            args[5]._obj.value = hv.ParamType.NUMERIC
+            return DEFAULT
+        self.mock_lib.get_ch_param_prop.side_effect = get_ch_param_prop_side_effect
+        events = (hv._EventDataRaw * 3)()
+        for event, event_type, board_index, channel_index, item_id in (
+            (events[0], hv.EventType.PARAMETER, 0, 1, b'VMon'),
+            (events[1], hv.EventType.ALARM, -1, -1, b'Alarm'),
+            (events[2], hv.EventType.PARAMETER, -1, -1, b'SysProp'),
+        ):
+            event.Type = event_type
+            event.SystemHandle = device.handle
+            event.BoardIndex = board_index
+            event.ChannelIndex = channel_index
+            event.ItemID = item_id
+        events[0].Value.FloatValue = 1.5
+        events[2].Value.StringValue = b'Value'
+        def get_event_data_side_effect(*args):
+            args[1].System = hv.EventStatus.ASYNC
+            args[3].value = len(events)
+            return DEFAULT
+        self.mock_lib.get_event_data.side_effect = get_event_data_side_effect
+        self.mock_lib.evt_data_auto_ptr.return_value.__enter__.return_value = events
+        events_data, status = device.get_event_data()
+        self.assertEqual(events_data, (
+            hv.EventData(hv.EventType.PARAMETER, 'VMon', 0, 1, 1.5),
+            hv.EventData(hv.EventType.ALARM, 'Alarm', -1, -1, -1),
+            hv.EventData(hv.EventType.PARAMETER, 'SysProp', -1, -1, 'Value'),
+        ))
+        self.assertEqual(status, hv.SystemStatus(hv.EventStatus.ASYNC, (hv.EventStatus.SYNC,) * 16))
+
+    def test_get_event_data_library_event_thread(self):
+        """Test get_event_data on systems with library event thread"""
+        device = hv.Device.open(hv.SystemType.N1470, hv.LinkType.USB, '0_0_0')
+        self.addCleanup(device.close)
+        device.subscribe_channel_params(0, 1, ['VMon'])
+        port = self.mock_lib.subscribe_channel_params.call_args.args[1]
+        skt = socket.create_connection(('127.0.0.1', port))
+        self.addCleanup(skt.close)
+        skt.sendall(b'0_0_0\x00NextData')
+        self.mock_lib.evt_data_auto_ptr.return_value.__enter__.return_value = (hv._EventDataRaw * 0)()
+        events_data, _ = device.get_event_data()
+        self.assertEqual(events_data, ())
+        # Data following the InitSystem argument is left to the library
+        self.assertEqual(device._Device__skt_client.recv(8), b'NextData')
+
+class TestAutoPtr(unittest.TestCase):
+    """Test the _AutoPtr class."""
+
+    def test_free_on_exit(self):
+        """Test pointer is freed on exit, also on exceptions"""
+        freed = []
+        pointer = ct.POINTER(ct.c_char)()
+        with hv._AutoPtr(pointer, freed.append) as value:
+            self.assertIs(value, pointer)
+            self.assertFalse(value)
+        self.assertEqual(freed, [pointer])
+        with self.assertRaises(RuntimeError):
+            with hv._AutoPtr(pointer, freed.append):
+                raise RuntimeError
+        self.assertEqual(freed, [pointer, pointer])
+
 if __name__ == '__main__':
     unittest.main()